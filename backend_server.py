@@ -6,13 +6,21 @@ FastAPI-based semantic processing engine for enhanced AI classification
 
 import asyncio
 import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import uvicorn
 
@@ -22,15 +30,58 @@ logger = logging.getLogger(__name__)
 
 # Try to import ML dependencies with fallbacks
 try:
+    import torch
+    import torch.nn.functional as F
     from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
     HAS_ML = True
     logger.info("✅ ML dependencies loaded successfully")
 except ImportError as e:
     logger.warning(f"⚠️ ML dependencies not available: {e}")
-    logger.info("📦 Install with: pip install sentence-transformers scikit-learn")
+    logger.info("📦 Install with: pip install sentence-transformers")
     HAS_ML = False
 
+# Optional ONNX Runtime backend for fused, graph-optimized CPU inference
+try:
+    import onnxruntime  # noqa: F401
+    import optimum.onnxruntime  # noqa: F401
+    HAS_ORT = True
+except ImportError:
+    HAS_ORT = False
+
+# Exported ONNX graphs are cached here so the export only happens once
+ONNX_CACHE_DIR = Path.home() / ".cache" / "thinkerbell"
+
+# Fast non-cryptographic hashing for cache keys, with a builtin fallback
+try:
+    import xxhash
+    
+    def _text_key(text: str) -> int:
+        return xxhash.xxh64_intdigest(text.encode("utf-8"))
+except ImportError:
+    def _text_key(text: str) -> int:
+        return hash(text)
+
+# Rust-backed JSON serialization for routes returning plain dicts, with a stdlib fallback.
+# Routes with a response_model keep FastAPI's default class, which serializes via Pydantic.
+try:
+    import orjson
+    
+    class ORJSONResponse(JSONResponse):
+        def render(self, content) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    
+    DictResponse = ORJSONResponse
+except ImportError:
+    DictResponse = JSONResponse
+
+# Sentence boundary: terminal punctuation followed by whitespace
+_SENT_RE = re.compile(r'[.!?]+\s+')
+
+# Keyword cues for the fallback classifier, one alternation per category
+_WISDOM_RE = re.compile(r'\b(data|research|study|evidence|statistics|shows|analysis)\b')
+_NUDGE_RE = re.compile(r'\b(should|recommend|suggest|implement|action|do|try)\b')
+_SPELL_RE = re.compile(r'\b(imagine|creative|innovative|magical|surprising|extraordinary)\b')
+
 # Pydantic models
 class ProcessRequest(BaseModel):
     content: str
@@ -59,9 +110,18 @@ class SemanticBrain:
     
     def __init__(self):
         self.model = None
-        self.anchor_embeddings = {}
+        self.device = "cpu"
+        self.backend = "torch"
+        self._anchor_mat = None  # (C, D) L2-normalized anchor embeddings, row order matches _anchor_keys
+        self._anchor_keys: Tuple[str, ...] = ("Hunch", "Wisdom", "Nudge", "Spell")
         self.confidence_threshold = 0.3
         self.model_name = "all-MiniLM-L6-v2"
+        self.batch_size = 1024
+        self.embedding_cache_size = 10_000
+        self.result_cache_size = 1024
+        self._emb_cache = OrderedDict()
+        self._result_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         
     async def initialize(self):
         """Initialize ML models and anchor embeddings"""
@@ -70,15 +130,58 @@ class SemanticBrain:
             return False
             
         try:
-            logger.info(f"🔄 Loading semantic model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            logger.info(f"🔄 Loading semantic model: {self.model_name} on {self.device}")
+            if self.device == "cpu" and HAS_ORT:
+                self.model = self._load_onnx_model()
+            if self.model is None:
+                self.model = SentenceTransformer(self.model_name, device=self.device)
+            if self.device == "cuda":
+                # FP16 halves memory traffic and runs on Tensor Cores
+                self.model.half()
             await self._load_anchor_embeddings()
+            self._warmup()
             logger.info("✅ Semantic brain initialized successfully")
             return True
         except Exception as e:
             logger.error(f"❌ Failed to initialize semantic brain: {e}")
             return False
     
+    def _warmup(self):
+        """Run a dummy batch so kernel selection and allocator setup happen before the first request"""
+        start_time = time.perf_counter()
+        try:
+            self._encode(["warmup"] * 8)
+            _ = self._anchor_mat @ self._anchor_mat.T
+            if self.device == "cuda":
+                torch.cuda.synchronize()
+        except Exception as e:
+            # The model is loaded and usable; the first request just pays the setup cost
+            logger.warning(f"⚠️ Model warmup failed, continuing without it: {e}")
+            return
+        logger.info(f"🔥 Model warmed up in {(time.perf_counter() - start_time) * 1000:.0f}ms")
+    
+    def _load_onnx_model(self):
+        """Load the model on ONNX Runtime, exporting it once to the on-disk cache"""
+        export_dir = ONNX_CACHE_DIR / self.model_name.replace("/", "--")
+        exported = (export_dir / "onnx" / "model.onnx").exists()
+        
+        try:
+            model = SentenceTransformer(
+                str(export_dir) if exported else self.model_name,
+                device="cpu",
+                backend="onnx",
+                model_kwargs={"provider": "CPUExecutionProvider"}
+            )
+            if not exported:
+                model.save_pretrained(str(export_dir))
+            self.backend = "onnx"
+            logger.info(f"⚡ Using ONNX Runtime backend ({export_dir})")
+            return model
+        except Exception as e:
+            logger.warning(f"⚠️ ONNX Runtime backend unavailable, falling back to torch: {e}")
+            return None
+    
     async def _load_anchor_embeddings(self):
         """Precompute embeddings for Thinkerbell's semantic anchors"""
         anchors = {
@@ -105,113 +208,185 @@ class SemanticBrain:
         }
         
         # Compute embeddings for anchor descriptions
-        anchor_texts = list(anchors.values())
-        embeddings = self.model.encode(anchor_texts)
-        
-        self.anchor_embeddings = {
-            category: embeddings[i] 
-            for i, category in enumerate(anchors.keys())
-        }
+        anchor_texts = [anchors[category] for category in self._anchor_keys]
+        embeddings = self.model.encode(anchor_texts, convert_to_tensor=True)
+        
+        # Pre-normalize anchors once so each similarity is a plain dot product
+        anchor_mat = F.normalize(embeddings, dim=1).to(self.model.device).contiguous()
+        if self.device == "cuda":
+            # Keep anchors on-device so similarities never leave the GPU
+            self._anchor_mat = anchor_mat
+        else:
+            # CPU tensors share memory with numpy, so this is a zero-copy view
+            self._anchor_mat = anchor_mat.float().numpy()
         
         logger.info("🧠 Anchor embeddings computed and cached")
+    
+    @property
+    def anchor_embeddings(self) -> Dict:
+        """Per-category view of the anchor matrix (rows share its memory)"""
+        if self._anchor_mat is None:
+            return {}
+        return dict(zip(self._anchor_keys, self._anchor_mat))
 
-    async def classify_text(self, text: str, confidence_threshold: float = None) -> Dict:
-        """Main classification endpoint with enhanced AI processing"""
-        start_time = asyncio.get_event_loop().time()
+    def classify_text(self, text: str, confidence_threshold: float = None) -> Dict:
+        """Main classification endpoint with enhanced AI processing (CPU-bound, run off the event loop)"""
+        start_time = time.perf_counter()
         
-        if not self.model:
+        if not self.model or self._anchor_mat is None:
             return self._fallback_classification(text)
         
         threshold = confidence_threshold or self.confidence_threshold
         
-        # Process text into sentences
+        # Exact-match cache for resubmitted briefs
+        result_key = (_text_key(text), threshold)
+        with self._cache_lock:
+            cached = self._result_cache.get(result_key)
+            if cached is not None:
+                self._result_cache.move_to_end(result_key)
+        if cached is not None:
+            processing_time = (time.perf_counter() - start_time) * 1000
+            return {**cached, "processing_time_ms": processing_time}
+        
+        # Process text into sentences (already filtered to meaningful length)
         sentences = self._split_sentences(text)
         routed_content = {}
+        category_idx = np.empty(0, dtype=np.intp)
+        scores = np.empty(0, dtype=np.float32)
         
-        for sentence in sentences:
-            if len(sentence.strip()) < 10:  # Skip very short sentences
-                continue
-                
-            category, confidence = await self._classify_sentence(sentence, threshold)
+        if sentences:
+            embeddings = self._encode_sentences(sentences)
+            category_idx, scores = self._classify_embeddings(embeddings, threshold)
             
-            if category not in routed_content:
-                routed_content[category] = []
-                
-            routed_content[category].append({
-                "text": sentence.strip(),
-                "confidence": float(confidence),
-                "processing_method": "sentence_transformer"
-            })
-        
-        # Sort by confidence within each category
-        for category in routed_content:
-            routed_content[category].sort(
-                key=lambda x: x["confidence"], 
-                reverse=True
-            )
+            # Seed categories in first-seen sentence order, matching analytics.distribution
+            first_seen = np.unique(category_idx, return_index=True)[1]
+            for c in category_idx[np.sort(first_seen)]:
+                routed_content[self._anchor_keys[c]] = []
+            
+            # Visit sentences in descending confidence so each category list comes out sorted
+            for i in np.argsort(-scores, kind="stable"):
+                routed_content[self._anchor_keys[category_idx[i]]].append({
+                    "text": sentences[i],
+                    "confidence": float(scores[i]),
+                    "processing_method": "sentence_transformer"
+                })
         
         # Generate analytics
-        analytics = self._generate_analytics(routed_content)
+        analytics = self._generate_analytics(category_idx, scores)
         
-        processing_time = (asyncio.get_event_loop().time() - start_time) * 1000
+        processing_time = (time.perf_counter() - start_time) * 1000
         
-        return {
+        result = {
             "routed_content": routed_content,
             "analytics": analytics,
             "processing_time_ms": processing_time
         }
+        with self._cache_lock:
+            self._cache_put(self._result_cache, result_key, dict(result), self.result_cache_size)
+        return result
+    
+    def _encode(self, texts: List[str]):
+        """Run the model on a batch of texts, returning normalized (B, D) embeddings
+        
+        On GPU the result stays on-device as a torch tensor; on CPU it is a single
+        contiguous float32 numpy array with no per-row allocation.
+        """
+        on_gpu = self.device == "cuda"
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=not on_gpu,
+            convert_to_tensor=on_gpu,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        return embeddings if on_gpu else np.ascontiguousarray(embeddings)
+    
+    def _encode_sentences(self, sentences: List[str]):
+        """Encode sentences as a normalized (B, D) batch, reusing cached embeddings"""
+        keys = [_text_key(sentence.strip().lower()) for sentence in sentences]
+        found = {}
+        pending = {}  # Cache misses, deduplicated by key
+        
+        with self._cache_lock:
+            for sentence, key in zip(sentences, keys):
+                if key in found or key in pending:
+                    continue
+                cached = self._emb_cache.get(key)
+                if cached is None:
+                    pending[key] = sentence
+                else:
+                    self._emb_cache.move_to_end(key)
+                    found[key] = cached
+        
+        if pending:
+            # Encode every miss in one padded batch instead of one forward pass each
+            encoded = self._encode(list(pending.values()))
+            with self._cache_lock:
+                for key, embedding in zip(pending, encoded):
+                    found[key] = embedding
+                    # Copy rows so cached entries don't pin the whole batch in memory
+                    row = embedding.clone() if torch.is_tensor(embedding) else embedding.copy()
+                    self._cache_put(self._emb_cache, key, row, self.embedding_cache_size)
+            
+            if len(pending) == len(keys):
+                # All distinct misses: the encoded batch is already in sentence order
+                return encoded
+        
+        rows = [found[key] for key in keys]
+        return torch.stack(rows) if self.device == "cuda" else np.stack(rows)
     
-    async def _classify_sentence(self, sentence: str, threshold: float) -> Tuple[str, float]:
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, max_size: int):
+        """Insert into an LRU cache, evicting the least recently used entries"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+    
+    def _classify_sentence(self, sentence: str, threshold: float) -> Tuple[str, float]:
         """Classify individual sentence using semantic similarity"""
-        if not self.model or not self.anchor_embeddings:
+        if not self.model or self._anchor_mat is None:
             return "Hunch", 0.5  # Fallback
         
         try:
-            # Get sentence embedding
-            sentence_embedding = self.model.encode([sentence])
-            
-            # Compute similarities to all anchors
-            similarities = {}
-            for category, anchor_embedding in self.anchor_embeddings.items():
-                similarity = cosine_similarity(
-                    sentence_embedding, 
-                    [anchor_embedding]
-                )[0][0]
-                similarities[category] = similarity
-            
-            # Find best match
-            best_category = max(similarities.keys(), key=lambda k: similarities[k])
-            best_score = similarities[best_category]
-            
-            # Apply confidence threshold
-            if best_score < threshold:
-                return "Hunch", best_score  # Default to Hunch for low confidence
-                
-            return best_category, best_score
+            # Sentences already seen by /process are answered from the embedding cache
+            sentence_embedding = self._encode_sentences([sentence.strip()])
+            category_idx, scores = self._classify_embeddings(sentence_embedding, threshold)
+            return self._anchor_keys[category_idx[0]], scores[0]
             
         except Exception as e:
             logger.error(f"Classification error: {e}")
             return "Hunch", 0.3
     
+    def _classify_embeddings(self, embeddings, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Assign a category index and confidence to each row of a normalized (B, D) embedding batch"""
+        # Cosine similarity of every sentence to every anchor as a single (B, C) matmul
+        similarities = embeddings @ self._anchor_mat.T
+        if torch.is_tensor(similarities):
+            # Only the (B,) winners are copied back to the host
+            best_scores, best_idx = similarities.float().max(dim=1)
+            best_idx, best_scores = best_idx.cpu().numpy(), best_scores.cpu().numpy()
+        else:
+            best_idx = np.argmax(similarities, axis=1)
+            best_scores = similarities.max(axis=1)
+        
+        # Default to Hunch for low confidence
+        best_idx = np.where(best_scores >= threshold, best_idx, self._anchor_keys.index("Hunch"))
+        return best_idx, best_scores
+    
     def _split_sentences(self, text: str) -> List[str]:
         """Smart sentence splitting with context preservation"""
-        import re
-        
-        # Split on sentence endings, but preserve context
-        sentences = re.split(r'[.!?]+\s+', text)
-        
-        # Clean and filter sentences
-        cleaned = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 10:  # Minimum length for meaningful classification
-                cleaned.append(sentence)
-        
-        return cleaned
+        # Split on sentence endings, keeping only sentences long enough to classify
+        return [s for s in map(str.strip, _SENT_RE.split(text)) if len(s) > 10]
     
-    def _generate_analytics(self, routed_content: Dict) -> Dict:
-        """Generate comprehensive analytics about the classification"""
-        total_items = sum(len(items) for items in routed_content.values())
+    def _generate_analytics(self, category_idx: np.ndarray, scores: np.ndarray, include_empty: bool = False) -> Dict:
+        """Generate comprehensive analytics from per-sentence category indices and confidences
+        
+        Categories are reported in first-seen sentence order (or fixed anchor order with
+        include_empty), and ties for the dominant category go to the earliest listed one.
+        """
+        total_items = int(category_idx.size)
         
         if total_items == 0:
             return {
@@ -219,46 +394,48 @@ class SemanticBrain:
                 "total_sentences": 0
             }
         
-        # Calculate distribution
+        # Per-category count, sum, max and min in one vectorized pass each
+        n_categories = len(self._anchor_keys)
+        counts = np.bincount(category_idx, minlength=n_categories)
+        sums = np.bincount(category_idx, weights=scores, minlength=n_categories)
+        maxs = np.full(n_categories, -np.inf)
+        mins = np.full(n_categories, np.inf)
+        np.maximum.at(maxs, category_idx, scores)
+        np.minimum.at(mins, category_idx, scores)
+        
+        # Builtin round() on the few reduced values keeps results identical to the scalar version
+        present = counts > 0
+        percentages = [round(x, 1) for x in (counts / total_items * 100).tolist()]
+        averages = [round(x, 3) for x in np.where(present, sums / np.maximum(counts, 1), 0).tolist()]
+        maxs = [round(x, 3) for x in np.where(present, maxs, 0).tolist()]
+        mins = [round(x, 3) for x in np.where(present, mins, 0).tolist()]
+        
+        if include_empty:
+            order = np.arange(n_categories)
+        else:
+            first_seen = np.unique(category_idx, return_index=True)[1]
+            order = category_idx[np.sort(first_seen)]
+        
         distribution = {}
         confidence_stats = {}
-        
-        for category, items in routed_content.items():
-            count = len(items)
+        for c in order:
+            category = self._anchor_keys[c]
             distribution[category] = {
-                "count": count,
-                "percentage": round(count / total_items * 100, 1)
+                "count": int(counts[c]),
+                "percentage": percentages[c]
+            }
+            confidence_stats[category] = {
+                "average": averages[c],
+                "max": maxs[c],
+                "min": mins[c]
             }
-            
-            if items:
-                confidences = [item["confidence"] for item in items]
-                confidence_stats[category] = {
-                    "average": round(sum(confidences) / len(confidences), 3),
-                    "max": round(max(confidences), 3),
-                    "min": round(min(confidences), 3)
-                }
-            else:
-                confidence_stats[category] = {"average": 0, "max": 0, "min": 0}
-        
-        # Find dominant category
-        dominant_category = max(
-            distribution.keys(), 
-            key=lambda k: distribution[k]["count"]
-        ) if distribution else "Hunch"
-        
-        # Calculate high confidence items
-        high_confidence_count = sum(
-            1 for items in routed_content.values() 
-            for item in items 
-            if item["confidence"] > 0.7
-        )
         
         return {
             "distribution": distribution,
             "confidence_stats": confidence_stats,
-            "dominant_category": dominant_category,
+            "dominant_category": self._anchor_keys[order[np.argmax(counts[order])]],
             "total_sentences": total_items,
-            "high_confidence_items": high_confidence_count,
+            "high_confidence_items": int((scores > 0.7).sum()),
             "processing_method": "python_sentence_transformer"
         }
     
@@ -267,7 +444,9 @@ class SemanticBrain:
         logger.info("Using fallback keyword-based classification")
         
         sentences = self._split_sentences(text)
-        routed_content = {"Hunch": [], "Wisdom": [], "Nudge": [], "Spell": []}
+        routed_content = {category: [] for category in self._anchor_keys}
+        category_idx = []
+        scores = []
         
         # Simple keyword-based classification
         for sentence in sentences:
@@ -278,13 +457,13 @@ class SemanticBrain:
             confidence = 0.5  # Default confidence for keyword matching
             
             # Classify based on keywords
-            if any(word in lower_sentence for word in ['data', 'research', 'study', 'evidence', 'statistics', 'shows', 'analysis']):
+            if _WISDOM_RE.search(lower_sentence):
                 category = "Wisdom"
                 confidence = 0.7
-            elif any(word in lower_sentence for word in ['should', 'recommend', 'suggest', 'implement', 'action', 'do', 'try']):
+            elif _NUDGE_RE.search(lower_sentence):
                 category = "Nudge"
                 confidence = 0.6
-            elif any(word in lower_sentence for word in ['imagine', 'creative', 'innovative', 'magical', 'surprising', 'extraordinary']):
+            elif _SPELL_RE.search(lower_sentence):
                 category = "Spell"
                 confidence = 0.6
             else:
@@ -296,8 +475,14 @@ class SemanticBrain:
                 "confidence": confidence,
                 "processing_method": "keyword_fallback"
             })
+            category_idx.append(self._anchor_keys.index(category))
+            scores.append(confidence)
         
-        analytics = self._generate_analytics(routed_content)
+        analytics = self._generate_analytics(
+            np.asarray(category_idx, dtype=np.intp),
+            np.asarray(scores),
+            include_empty=True
+        )
         
         return {
             "routed_content": routed_content,
@@ -315,7 +500,9 @@ app = FastAPI(
 )
 
 # Add middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Only compress large payloads at the fastest level; skip entirely for local dev
+if os.getenv("THINKERBELL_ENV", "production") != "dev":
+    app.add_middleware(GZipMiddleware, minimum_size=4096, compresslevel=1)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:3001", "http://localhost:5173"],
@@ -327,16 +514,27 @@ app.add_middleware(
 # Global semantic brain instance
 semantic_brain = SemanticBrain()
 
+# Worker pool for CPU-bound classification so the event loop stays responsive
+_CPU_POOL: Optional[ThreadPoolExecutor] = None
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the semantic brain on startup"""
+    global _CPU_POOL
     logger.info("🚀 Starting Thinkerbell Python Backend Server...")
+    _CPU_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="semantic")
     success = await semantic_brain.initialize()
     if success:
         logger.info("✅ Server ready with advanced semantic processing")
     else:
         logger.info("⚠️ Server ready with fallback processing")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the classification worker pool"""
+    if _CPU_POOL is not None:
+        _CPU_POOL.shutdown(wait=False)
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
@@ -357,9 +555,11 @@ async def process_content(
     try:
         logger.info(f"Processing content: {len(request.content)} characters")
         
-        result = await semantic_brain.classify_text(
-            text=request.content,
-            confidence_threshold=request.confidence_threshold
+        result = await asyncio.get_running_loop().run_in_executor(
+            _CPU_POOL,
+            semantic_brain.classify_text,
+            request.content,
+            request.confidence_threshold
         )
         
         # Add metadata
@@ -378,7 +578,7 @@ async def process_content(
             detail=f"Processing failed: {str(e)}"
         )
 
-@app.post("/explain")
+@app.post("/explain", response_class=DictResponse)
 async def explain_classification(request: ExplainRequest):
     """Explain why content was classified a certain way"""
     try:
@@ -391,8 +591,10 @@ async def explain_classification(request: ExplainRequest):
             }
         
         # Get classification for single sentence
-        category, confidence = await semantic_brain._classify_sentence(
-            request.sentence, 
+        category, confidence = await asyncio.get_running_loop().run_in_executor(
+            _CPU_POOL,
+            semantic_brain._classify_sentence,
+            request.sentence,
             semantic_brain.confidence_threshold
         )
         
@@ -418,13 +620,15 @@ async def explain_classification(request: ExplainRequest):
         logger.error(f"Explanation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/models")
+@app.get("/models", response_class=DictResponse)
 async def list_models():
     """List available semantic models and their status"""
     return {
         "current_model": semantic_brain.model_name if semantic_brain.model else "none",
+        "inference_backend": semantic_brain.backend if semantic_brain.model else "none",
         "ml_dependencies_available": HAS_ML,
         "model_loaded": semantic_brain.model is not None,
+        "anchor_categories": list(semantic_brain.anchor_embeddings),
         "available_models": [
             {
                 "name": "all-MiniLM-L6-v2",
@@ -442,7 +646,7 @@ async def list_models():
         "fallback_method": "keyword-based classification"
     }
 
-@app.get("/")
+@app.get("/", response_class=DictResponse)
 async def root():
     """Root endpoint with API information"""
     return {
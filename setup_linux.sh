@@ -40,7 +40,7 @@ cd ..
 # Install Python dependencies
 echo ""
 echo "🐍 Installing Python dependencies..."
-pip3 install fastapi uvicorn sentence-transformers scikit-learn numpy
+pip3 install fastapi uvicorn sentence-transformers numpy
 
 echo ""
 echo "✅ Setup complete!"
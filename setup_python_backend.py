@@ -50,7 +50,6 @@ def test_ml_dependencies():
     
     try:
         import sentence_transformers
-        import sklearn
         import numpy
         print("✅ All ML dependencies available")
         return True